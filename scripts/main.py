@@ -2,6 +2,7 @@
 """
 GOMSGGW Client Manager - CLI tool for managing SMS/MMS gateway clients and carriers.
 """
+import functools
 import os
 import sys
 import json
@@ -9,100 +10,343 @@ import getpass
 import re
 import secrets
 import string
-from typing import List, Optional, Tuple, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
+from typing import List, Optional, Tuple, Dict, Any, Iterable, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+try:
+    import ijson  # optional: incremental parsing of large listings
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 DEFAULT_BASE_URL = os.getenv("MSGGW_BASE_URL", "http://API_URL")
 API_KEY = os.getenv("MSGGW_API_KEY", "API_KEY")
 
 TIMEOUT = 15
+CACHE_TTL = 10  # seconds a cached GET stays fresh
+ADD_WORKERS = 8  # concurrent POSTs when adding numbers
+PARALLEL_MIN = 4  # below this many numbers, add serially
+STREAM_MIN_BYTES = 256 * 1024  # stream larger listings when ijson is installed
+FLUSH_ROWS = 500  # rows buffered per stdout write in streamed listings
 NUM_RE = re.compile(r"^\s*\d{10,11}\s*$")
+_NON_DIGIT = re.compile(r"\D")
+# A paste made only of plain 10/11-digit numbers separated by commas/newlines
+_PLAIN_NUMBERS = re.compile(r"[\s,]*(?:[0-9]{10,11}[^\S\n]*(?:[,\n][\s,]*|\Z))*")
+_NUM_EXTRACT = re.compile(r"[0-9]{10,11}")
+# Deletes every Latin-1 character except 0-9
+_KEEP_DIGITS = str.maketrans("", "", "".join(chr(c) for c in range(256) if chr(c) not in string.digits))
+
+_PASSWORD_ALPHABET = (string.ascii_letters + string.digits).encode()
+_PASSWORD_TABLE = bytes(_PASSWORD_ALPHABET[b % len(_PASSWORD_ALPHABET)] for b in range(256))
+_PASSWORD_REJECT = bytes(range(256 // len(_PASSWORD_ALPHABET) * len(_PASSWORD_ALPHABET), 256))
+
+# One pooled session for the whole CLI run so keep-alive reuses the same
+# connection instead of paying a TCP/TLS handshake on every request.
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=16,
+    # Transient gateway/load-balancer errors are retried in-process over the
+    # same connection, for idempotent methods only.
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+# POSTs that are safe to repeat (number adds report existing numbers as
+# skipped, reloads are idempotent) opt in to retries through this session.
+# read=0 so a request the gateway may already be processing is never re-sent
+# after a timeout.
+RETRY_SESSION = requests.Session()
+_RETRY_ADAPTER = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False,
+    ),
+)
+RETRY_SESSION.mount("https://", _RETRY_ADAPTER)
+RETRY_SESSION.mount("http://", _RETRY_ADAPTER)
+
+# Errors that can surface while reading a streamed body: requests wraps them
+# for resp.content, but ijson reading resp.raw sees urllib3's and its own.
+_STREAM_ERRORS: Tuple[type, ...] = (requests.RequestException, ValueError, ProtocolError, ReadTimeoutError)
+if ijson is not None:
+    _STREAM_ERRORS += (ijson.JSONError,)
+
+# path -> (fetched_at, response) for cached_get_json()
+_CACHE: Dict[str, Tuple[float, requests.Response]] = {}
+# path -> (response, by_id, by_username) for client_index()
+_CLIENT_INDEX: Dict[str, Tuple[requests.Response, Dict[Any, Dict[str, Any]], Dict[Any, Dict[str, Any]]]] = {}
+# Set once an older gateway shows it lacks GET /clients/{id} or ignores the
+# ?username= filter; lookups then go straight to the cached /clients list.
+_NO_CLIENT_BY_ID = False
+_NO_USERNAME_FILTER = False
 
 
 def generate_password(length: int = 24) -> str:
     """Generate a strong random password."""
-    alphabet = string.ascii_letters + string.digits
     while True:
-        pwd = "".join(secrets.choice(alphabet) for _ in range(length))
-        if (
-            any(c.islower() for c in pwd)
-            and any(c.isupper() for c in pwd)
-            and any(c.isdigit() for c in pwd)
-        ):
-            return pwd
+        # Map random bytes onto the alphabet in one C-level translate; bytes
+        # past the last full multiple of the alphabet size are dropped so
+        # every character stays equally likely.
+        pwd = secrets.token_bytes(length * 2).translate(_PASSWORD_TABLE, _PASSWORD_REJECT)
+        if len(pwd) < length:
+            continue
+        pwd = pwd[:length]
+        if pwd.upper() != pwd and pwd.lower() != pwd and not pwd.isalpha():
+            return pwd.decode()
 
 
-def auth_tuple() -> Tuple[str, str]:
-    key = API_KEY
-    if not key or key == "API_KEY":
+# Admin credentials, resolved on first use by auth_tuple()
+_AUTH: Optional[Tuple[str, str]] = None
+
+
+def _load_key() -> str:
+    """Return the admin API key, prompting (once) if it is not configured."""
+    global API_KEY
+    if not API_KEY or API_KEY == "API_KEY":
         print("No MSGGW_API_KEY in environment. Enter it now.")
         key = getpass.getpass("API key: ").strip()
         if not key:
             print("Error: API key required.", file=sys.stderr)
             sys.exit(1)
-    return ("apikey", key)
+        API_KEY = key
+    return API_KEY
 
 
+def auth_tuple() -> Tuple[str, str]:
+    global _AUTH
+    if _AUTH is None:
+        _AUTH = ("apikey", _load_key())
+    return _AUTH
+
+
+@functools.lru_cache(maxsize=1)
 def base_url() -> str:
     return os.getenv("MSGGW_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
 
 
-def get_json(path: str) -> requests.Response:
+def write_rows(rows: List[str]) -> None:
+    """Write table rows to stdout in a single call."""
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
+
+
+def _dumps(payload: Any) -> bytes:
+    """Encode a request body as JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _loads(resp: requests.Response) -> Any:
+    """Decode a response body as JSON."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return json.loads(resp.content)
+
+
+def _err_body(resp: requests.Response) -> Any:
+    """Return an error response body as parsed JSON, or as text if it is not JSON.
+
+    The result is kept on the response, so later calls don't parse it again.
+    """
+    try:
+        return resp._err_body
+    except AttributeError:
+        pass
+    try:
+        body = _loads(resp)
+    except ValueError:
+        body = resp.text
+    resp._err_body = body
+    return body
+
+
+def get_json(path: str, stream: bool = False) -> requests.Response:
     url = f"{base_url()}{path}"
-    return requests.get(url, auth=auth_tuple(), timeout=TIMEOUT)
+    return SESSION.get(url, auth=auth_tuple(), timeout=TIMEOUT, stream=stream)
 
 
-def post_json(path: str, payload: dict) -> requests.Response:
+def iter_json_items(resp: requests.Response) -> Iterable[Any]:
+    """Yield the elements of a JSON array response.
+
+    Large or unsized bodies are parsed incrementally with ijson (when
+    installed) so rows can be handled as they arrive; anything else is
+    parsed in one go.
+    """
+    length = resp.headers.get("Content-Length")
+    if ijson is None or (length is not None and int(length) < STREAM_MIN_BYTES):
+        return _loads(resp) or []
+    resp.raw.decode_content = True
+    return ijson.items(resp.raw, "item")
+
+
+def post_json(path: str, payload: dict, session: requests.Session = SESSION) -> requests.Response:
     url = f"{base_url()}{path}"
-    return requests.post(
+    return session.post(
         url,
         auth=auth_tuple(),
         headers={"Content-Type": "application/json"},
-        data=json.dumps(payload),
+        data=_dumps(payload),
         timeout=TIMEOUT,
     )
 
 
+def cached_get_json(path: str, ttl: float = CACHE_TTL) -> requests.Response:
+    """GET with a short in-memory TTL cache; only 200 responses are kept."""
+    now = time.monotonic()
+    hit = _CACHE.get(path)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    resp = get_json(path)
+    if resp.status_code == 200:
+        _CACHE[path] = (now, resp)
+    return resp
+
+
+def invalidate_cache(*prefixes: str) -> None:
+    """Drop cached GETs whose path starts with any of the given prefixes."""
+    for cache in (_CACHE, _CLIENT_INDEX):
+        for path in list(cache):
+            if path.startswith(prefixes):
+                del cache[path]
+
+
+def client_index(
+    path: str = "/clients",
+) -> Optional[Tuple[Dict[Any, Dict[str, Any]], Dict[Any, Dict[str, Any]]]]:
+    """Return (by_id, by_username) for a cached client list.
+
+    The dicts are built once per cached response, so repeated lookups are
+    plain dict hits. Returns None if the list could not be fetched.
+    """
+    resp = cached_get_json(path)
+    if resp.status_code != 200:
+        return None
+    hit = _CLIENT_INDEX.get(path)
+    if hit and hit[0] is resp:
+        return hit[1], hit[2]
+    clients = _loads(resp) or []
+    by_id = {c.get("id"): c for c in clients}
+    by_username = {c.get("username"): c for c in clients}
+    _CLIENT_INDEX[path] = (resp, by_id, by_username)
+    return by_id, by_username
+
+
 def put_json(path: str, payload: dict) -> requests.Response:
     url = f"{base_url()}{path}"
-    return requests.put(
+    return SESSION.put(
         url,
         auth=auth_tuple(),
         headers={"Content-Type": "application/json"},
-        data=json.dumps(payload),
+        data=_dumps(payload),
         timeout=TIMEOUT,
     )
 
 
+# =============================================================================
+# Input Validation
+# =============================================================================
+
+# Field -> lower bound: the minimum length of a str field (1 = required) or
+# the minimum value of an int field. Only rules the gateway itself enforces
+# are listed, so input it would reject with a 400 is caught before any
+# request is sent.
+_CARRIER_SCHEMA: Dict[str, int] = {
+    "username": 1,
+    "password": 1,
+}
+
+
+def _validate(payload: Dict[str, Any], schema: Dict[str, int]) -> List[str]:
+    """Check payload fields against a schema; returns a list of problems.
+
+    Fields missing from the payload are not checked.
+    """
+    errors = []
+    for field, lo in schema.items():
+        if field not in payload:
+            continue
+        value = payload[field]
+        if isinstance(value, str):
+            if len(value) < lo:
+                errors.append(f"{field}: is required")
+        elif value < lo:
+            errors.append(f"{field}: must be >= {lo}")
+    return errors
+
+
+def _prompt_valid(
+    prompt: Callable[[], Optional[Dict[str, Any]]], schema: Dict[str, int]
+) -> Optional[Dict[str, Any]]:
+    """Run prompt() until its payload passes the schema; None if abandoned."""
+    while True:
+        payload = prompt()
+        if payload is None:
+            return None
+        errors = _validate(payload, schema)
+        if not errors:
+            return payload
+        print("❌ Invalid input:")
+        for err in errors:
+            print(f"  - {err}")
+        if input("Try again? [Y/n]: ").strip().lower() == "n":
+            return None
+
+
 # =============================================================================
 # Carrier Operations
 # =============================================================================
 
-def list_carriers() -> Optional[List[Dict[str, Any]]]:
-    """List all carriers from the gateway."""
-    print("\n=== All Carriers ===")
+def fetch_carriers() -> Optional[List[Dict[str, Any]]]:
+    """Fetch all carriers from the gateway (cached); None on failure."""
     try:
-        resp = get_json("/carriers")
+        resp = cached_get_json("/carriers")
     except requests.RequestException as e:
         print(f"Network error: {e}")
         return None
 
     if resp.status_code != 200:
         print(f"❌ Failed to list carriers ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
         return None
 
-    carriers = resp.json()
+    return _loads(resp) or []
+
+
+def render_carriers(carriers: List[Dict[str, Any]]) -> None:
+    """Print carriers as a table."""
     if not carriers:
         print("No carriers found.")
-        return []
+        return
 
-    print(f"\n{'Name':<20} {'Type':<12} {'Active':<8} {'SMS Limit':<12} {'MMS Limit':<12}")
-    print("-" * 70)
+    rows = [
+        f"\n{'Name':<20} {'Type':<12} {'Active':<8} {'SMS Limit':<12} {'MMS Limit':<12}",
+        "-" * 70,
+    ]
     for c in carriers:
         name = c.get("name", "")[:20]
         ctype = c.get("type", "")[:12]
@@ -111,16 +355,29 @@ def list_carriers() -> Optional[List[Dict[str, Any]]]:
         mms_limit = c.get("mms_limit", 0)
         sms_str = f"{sms_limit:,}" if sms_limit > 0 else "unlimited"
         mms_str = f"{mms_limit:,}" if mms_limit > 0 else "unlimited"
-        print(f"{name:<20} {ctype:<12} {active:<8} {sms_str:<12} {mms_str:<12}")
+        rows.append(f"{name:<20} {ctype:<12} {active:<8} {sms_str:<12} {mms_str:<12}")
+    write_rows(rows)
 
     print(f"\nTotal: {len(carriers)} carriers")
+
+
+def print_carrier_names(carriers: List[Dict[str, Any]]) -> None:
+    """Print carrier names on a single line."""
+    names = [c.get("name", "") for c in carriers]
+    print(f"  {', '.join(names)}" if names else "  No carriers found.")
+
+
+def list_carriers() -> Optional[List[Dict[str, Any]]]:
+    """List all carriers from the gateway."""
+    print("\n=== All Carriers ===")
+    carriers = fetch_carriers()
+    if carriers is not None:
+        render_carriers(carriers)
     return carriers
 
 
-def create_carrier_interactive() -> Optional[str]:
-    """Interactively create a new carrier."""
-    print("\n=== Create New Carrier ===")
-    
+def _prompt_carrier() -> Optional[Dict[str, Any]]:
+    """Prompt for a new carrier's fields and return the request payload."""
     name = input("Carrier Name (e.g., telnyx_prod): ").strip()
     if not name:
         print("Name is required.")
@@ -138,7 +395,7 @@ def create_carrier_interactive() -> Optional[str]:
     print(f"\nEnter {carrier_type.upper()} credentials:")
     if carrier_type == "telnyx":
         username = input("API Key: ").strip()
-        password = input("API Secret (or leave blank): ").strip() or ""
+        password = input("API Secret: ").strip()
     elif carrier_type == "twilio":
         username = input("Account SID: ").strip()
         password = getpass.getpass("Auth Token: ").strip()
@@ -159,7 +416,7 @@ def create_carrier_interactive() -> Optional[str]:
     except ValueError:
         mms_limit = 1048576
 
-    payload = {
+    return {
         "name": name,
         "type": carrier_type,
         "username": username,
@@ -168,6 +425,15 @@ def create_carrier_interactive() -> Optional[str]:
         "mms_limit": mms_limit,
     }
 
+
+def create_carrier_interactive() -> Optional[str]:
+    """Interactively create a new carrier."""
+    print("\n=== Create New Carrier ===")
+    payload = _prompt_valid(_prompt_carrier, _CARRIER_SCHEMA)
+    if payload is None:
+        return None
+    name, carrier_type = payload["name"], payload["type"]
+
     try:
         resp = post_json("/carriers", payload)
     except requests.RequestException as e:
@@ -175,14 +441,12 @@ def create_carrier_interactive() -> Optional[str]:
         return None
 
     if 200 <= resp.status_code < 300:
+        invalidate_cache("/carriers")
         print(f"✅ Carrier created: {name} ({carrier_type})")
         return name
     else:
         print(f"❌ Failed to create carrier ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
         return None
 
 
@@ -196,6 +460,7 @@ def reload_carriers() -> None:
         return
 
     if 200 <= resp.status_code < 300:
+        invalidate_cache("/carriers")
         print("✅ Carriers reloaded.")
     else:
         print(f"❌ Reload failed ({resp.status_code})")
@@ -205,62 +470,92 @@ def reload_carriers() -> None:
 # Client Operations
 # =============================================================================
 
-def list_clients() -> Optional[List[Dict[str, Any]]]:
-    """List all clients from the gateway."""
+def list_clients() -> Optional[int]:
+    """List all clients from the gateway.
+
+    Rows are printed as they stream in and are not kept, so this returns the
+    number of clients listed (None on failure) rather than the client list.
+    """
     print("\n=== All Clients ===")
     try:
-        resp = get_json("/clients")
+        resp = get_json("/clients", stream=True)
     except requests.RequestException as e:
         print(f"Network error: {e}")
         return None
 
-    if resp.status_code != 200:
-        print(f"❌ Failed to list clients ({resp.status_code})")
-        return None
+    with resp:
+        if resp.status_code != 200:
+            print(f"❌ Failed to list clients ({resp.status_code})")
+            return None
 
-    clients = resp.json()
-    if not clients:
-        print("No clients found.")
-        return []
+        total = 0
+        rows = []
+        try:
+            for c in iter_json_items(resp):
+                if not total:
+                    rows.append(f"\n{'ID':<6} {'Username':<18} {'Name':<22} {'Type':<8} {'Limit':<10} {'Nums':<6}")
+                    rows.append("-" * 75)
+                cid = str(c.get("id", ""))[:6]
+                username = c.get("username", "")[:18]
+                name = (c.get("name") or "")[:22]
+                ctype = c.get("type", "legacy")[:8]
+                limit = c.get("sms_limit", 0)
+                limit_str = str(limit) if limit > 0 else "∞"
+                num_count = len(c.get("numbers") or [])
+                rows.append(f"{cid:<6} {username:<18} {name:<22} {ctype:<8} {limit_str:<10} {num_count:<6}")
+                total += 1
+                if len(rows) >= FLUSH_ROWS:
+                    write_rows(rows)
+                    rows.clear()
+        except _STREAM_ERRORS as e:
+            write_rows(rows)
+            print(f"Network error: {e}")
+            return None
+        write_rows(rows)
 
-    print(f"\n{'ID':<6} {'Username':<18} {'Name':<22} {'Type':<8} {'Limit':<10} {'Nums':<6}")
-    print("-" * 75)
-    for c in clients:
-        cid = str(c.get("id", ""))[:6]
-        username = c.get("username", "")[:18]
-        name = (c.get("name") or "")[:22]
-        ctype = c.get("type", "legacy")[:8]
-        limit = c.get("sms_limit", 0)
-        limit_str = str(limit) if limit > 0 else "∞"
-        num_count = len(c.get("numbers") or [])
-        print(f"{cid:<6} {username:<18} {name:<22} {ctype:<8} {limit_str:<10} {num_count:<6}")
+    if not total:
+        print("No clients found.")
+        return 0
 
-    print(f"\nTotal: {len(clients)} clients")
-    return clients
+    print(f"\nTotal: {total} clients")
+    return total
 
 
 def get_client_by_identifier(identifier: str) -> Optional[Dict[str, Any]]:
     """Get client by ID or username."""
+    global _NO_CLIENT_BY_ID, _NO_USERNAME_FILTER
     try:
-        resp = get_json("/clients")
+        if identifier.isdigit() and not _NO_CLIENT_BY_ID:
+            resp = cached_get_json(f"/clients/{identifier}")
+            if resp.status_code == 200:
+                return _loads(resp)
+            # The handler answers an unknown ID with a JSON error; a bare
+            # router 404/405 means the route itself is missing.
+            if resp.status_code in (404, 405) and not isinstance(_err_body(resp), dict):
+                _NO_CLIENT_BY_ID = True
+        if _NO_USERNAME_FILTER:
+            index = client_index("/clients")
+        else:
+            path = f"/clients?username={quote(identifier, safe='')}"
+            index = client_index(path)
+            # A gateway that ignores the filter sends back the full list:
+            # reuse it as the /clients entry and skip the filter from now on.
+            if index is not None and any(name != identifier for name in index[1]):
+                _NO_USERNAME_FILTER = True
+                if path in _CACHE:
+                    _CACHE.setdefault("/clients", _CACHE[path])
     except requests.RequestException as e:
         print(f"Network error: {e}")
         return None
 
-    if resp.status_code != 200:
+    if index is None:
         return None
 
-    clients = resp.json()
-    # Try ID first
-    if identifier.isdigit():
-        for c in clients:
-            if c.get("id") == int(identifier):
-                return c
-    # Then try username
-    for c in clients:
-        if c.get("username") == identifier:
-            return c
-    return None
+    by_id, by_username = index
+    # Try ID first, then username
+    if identifier.isdigit() and int(identifier) in by_id:
+        return by_id[int(identifier)]
+    return by_username.get(identifier)
 
 
 def get_client(username: str) -> Optional[Dict[str, Any]]:
@@ -295,7 +590,7 @@ def show_client_details(identifier: str) -> None:
     # Numbers
     numbers = client.get("numbers") or []
     if numbers:
-        print(f"\n  Numbers ({len(numbers)}):")
+        rows = [f"\n  Numbers ({len(numbers)}):"]
         for n in numbers:
             num = n.get("number", "")
             carrier = n.get("carrier", "")
@@ -303,25 +598,21 @@ def show_client_details(identifier: str) -> None:
             limit = n.get("sms_limit", 0)
             limit_str = f" (limit: {limit})" if limit > 0 else ""
             tag_str = f" [{tag}]" if tag else ""
-            print(f"    - {num} via {carrier}{tag_str}{limit_str}")
+            rows.append(f"    - {num} via {carrier}{tag_str}{limit_str}")
+        write_rows(rows)
     else:
         print("\n  No numbers configured.")
 
 
-def create_client_interactive() -> Optional[str]:
-    """Interactively create a new client."""
-    print("\n=== Create New Client ===")
+def _prompt_client() -> Optional[Dict[str, Any]]:
+    """Prompt for a new client's fields and return the request payload."""
     username = input("Username (e.g., tops_zultys): ").strip()
     if not username:
         print("Username is required.")
         return None
 
+    # A blank password is generated by the caller once the input is valid.
     password = getpass.getpass("Password (leave blank to auto-generate): ").strip()
-    if not password:
-        password = generate_password()
-        print("\n🔑 Generated password (save this now; it will not be shown again):")
-        print(f"  {password}\n")
-
     name = input("Display Name (company name): ").strip()
 
     # Client type
@@ -356,6 +647,21 @@ def create_client_interactive() -> Optional[str]:
     }
     if address:
         payload["address"] = address
+    return payload
+
+
+def create_client_interactive() -> Optional[str]:
+    """Interactively create a new client."""
+    print("\n=== Create New Client ===")
+    payload = _prompt_client()
+    if payload is None:
+        return None
+    username, client_type = payload["username"], payload["type"]
+
+    if not payload["password"]:
+        payload["password"] = generate_password()
+        print("\n🔑 Generated password (save this now; it will not be shown again):")
+        print(f"  {payload['password']}\n")
 
     try:
         resp = post_json("/clients", payload)
@@ -364,29 +670,19 @@ def create_client_interactive() -> Optional[str]:
         return None
 
     if 200 <= resp.status_code < 300:
-        data = resp.json()
+        invalidate_cache("/clients")
+        data = _loads(resp)
         client_id = data.get("id", "?")
         print(f"✅ Client created: {username} (ID: {client_id}, Type: {client_type})")
         return str(client_id)  # Return ID instead of username
     else:
         print(f"❌ Failed to create client ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
         return None
 
 
-def update_client_settings(identifier: str) -> None:
-    """Update web client settings (by ID or username)."""
-    client = get_client_by_identifier(identifier)
-    if not client:
-        print(f"Client '{identifier}' not found.")
-        return
-    
-    client_id = client.get("id")
-    print(f"\n=== Update Settings for '{client.get('username')}' (ID: {client_id}) ===")
-
+def _prompt_client_settings() -> Dict[str, Any]:
+    """Prompt for web client settings; blank answers are left out."""
     settings = {}
     
     print("\nAPI Format:")
@@ -415,7 +711,20 @@ def update_client_settings(identifier: str) -> None:
             settings["webhook_timeout_secs"] = int(timeout)
         except ValueError:
             pass
+    return settings
 
+
+def update_client_settings(identifier: str) -> None:
+    """Update web client settings (by ID or username)."""
+    client = get_client_by_identifier(identifier)
+    if not client:
+        print(f"Client '{identifier}' not found.")
+        return
+    
+    client_id = client.get("id")
+    print(f"\n=== Update Settings for '{client.get('username')}' (ID: {client_id}) ===")
+
+    settings = _prompt_client_settings()
     if not settings:
         print("No settings to update.")
         return
@@ -427,13 +736,11 @@ def update_client_settings(identifier: str) -> None:
         return
 
     if 200 <= resp.status_code < 300:
+        invalidate_cache("/clients")
         print("✅ Settings updated.")
     else:
         print(f"❌ Failed ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
 
 
 # =============================================================================
@@ -450,7 +757,11 @@ def get_client_numbers(username: str) -> List[str]:
 
 def normalize_number(num: str) -> str:
     """Normalize a phone number to digits only."""
-    return re.sub(r"[^\d]", "", num)
+    if num.isdecimal():
+        return num
+    digits = num.translate(_KEEP_DIGITS)
+    # Anything outside Latin-1 survives the table; let the regex finish it.
+    return digits if digits.isascii() else _NON_DIGIT.sub("", digits)
 
 
 def parse_numbers_csv(raw: str) -> List[str]:
@@ -462,10 +773,23 @@ def parse_numbers_csv(raw: str) -> List[str]:
       - E.164:     +12505551234    → 12505551234
       - With dashes/spaces: +1-250-555-1234 → 12505551234
     """
+    # Fast path: a paste of plain digit runs is validated and tokenized by
+    # the regex engine without any per-token Python work.
+    if _PLAIN_NUMBERS.fullmatch(raw):
+        valid = []
+        for num in _NUM_EXTRACT.findall(raw):
+            if len(num) == 10:
+                print(f"  ℹ️  {num} → 1{num}")
+                num = "1" + num
+            valid.append(num)
+        return valid
+
     parts = [p.strip() for p in raw.replace("\n", ",").split(",") if p.strip()]
     valid, invalid = [], []
     for p in parts:
-        normalized = normalize_number(p)  # strips to digits only
+        # Plain 10/11-digit entries (the common paste) need no stripping
+        digits = p if p.isdecimal() and 10 <= len(p) <= 11 else normalize_number(p)
+        normalized = digits
         if len(normalized) >= 10 and len(normalized) <= 15:
             # E.164 can be up to 15 digits; we want NANP 11-digit
             if len(normalized) == 10:
@@ -476,7 +800,7 @@ def parse_numbers_csv(raw: str) -> List[str]:
                 # but "112505551234" (extra leading 1) → take last 11
                 normalized = normalized[-11:]
             valid.append(normalized)
-            if normalized != normalize_number(p):
+            if normalized != digits:
                 print(f"  ℹ️  {p} → {normalized}")
         else:
             invalid.append(p)
@@ -487,6 +811,84 @@ def parse_numbers_csv(raw: str) -> List[str]:
     return valid
 
 
+def _add_number(client_id: Any, num: str, carrier: str) -> Tuple[str, str]:
+    """POST a single number and return (outcome, message).
+
+    outcome is one of "added", "skipped" or "failed".
+    """
+    payload = {"number": num, "carrier": carrier}
+    try:
+        resp = post_json(f"/clients/{client_id}/numbers", payload, RETRY_SESSION)
+    except requests.RequestException as e:
+        return "failed", f"❌ network error: {e}"
+
+    if 200 <= resp.status_code < 300:
+        return "added", "✅ added"
+    body = _err_body(resp)
+    err = body.get("error", str(body)) if isinstance(body, dict) else body
+    if "already exists" in str(err).lower():
+        return "skipped", "⏭️ already exists"
+    return "failed", f"❌ failed ({resp.status_code}) -> {err}"
+
+
+def _add_numbers_individually(
+    client_id: Any, to_add: List[str], carrier: str, counts: Dict[str, int]
+) -> None:
+    """Add numbers with one POST each, in parallel for larger lists."""
+    if len(to_add) < PARALLEL_MIN:
+        for num in to_add:
+            outcome, msg = _add_number(client_id, num, carrier)
+            print(f"  {num}: {msg}")
+            counts[outcome] += 1
+        return
+
+    # Overlap network latency across the pooled session; results are
+    # printed from this thread only, so output lines never interleave.
+    with ThreadPoolExecutor(max_workers=ADD_WORKERS) as ex:
+        futures = {ex.submit(_add_number, client_id, num, carrier): num for num in to_add}
+        for fut in as_completed(futures):
+            outcome, msg = fut.result()
+            print(f"  {futures[fut]}: {msg}")
+            counts[outcome] += 1
+
+
+def _add_numbers_batch(
+    client_id: Any, to_add: List[str], carrier: str, counts: Dict[str, int]
+) -> None:
+    """Add all numbers in a single request to the batch endpoint."""
+    payload = {"numbers": [{"number": num, "carrier": carrier} for num in to_add]}
+    try:
+        resp = post_json(f"/clients/{client_id}/numbers/batch", payload, RETRY_SESSION)
+    except requests.RequestException as e:
+        print(f"  ❌ network error: {e}")
+        counts["failed"] += len(to_add)
+        return
+
+    # The batch handler answers with a JSON {"error": ...} body (e.g. client
+    # not found); a bare router 404/405 means the gateway predates the
+    # endpoint, so fall back to one POST per number.
+    if resp.status_code in (404, 405) and not isinstance(_err_body(resp), dict):
+        _add_numbers_individually(client_id, to_add, carrier, counts)
+        return
+
+    if not 200 <= resp.status_code < 300:
+        print(f"  ❌ Failed to add numbers ({resp.status_code})")
+        print(_err_body(resp))
+        counts["failed"] += len(to_add)
+        return
+
+    result = _loads(resp)
+    for num in result.get("added") or []:
+        print(f"  {num}: ✅ added")
+        counts["added"] += 1
+    for num in result.get("skipped") or []:
+        print(f"  {num}: ⏭️ already exists")
+        counts["skipped"] += 1
+    for entry in result.get("failed") or []:
+        print(f"  {entry.get('number', '')}: ❌ failed -> {entry.get('error', '')}")
+        counts["failed"] += 1
+
+
 def add_numbers_to_client(
     identifier: str, numbers: List[str], carrier: str = "telnyx", skip_existing: bool = True
 ) -> None:
@@ -499,44 +901,27 @@ def add_numbers_to_client(
     client_id = client.get("id")
     print(f"\n=== Add Numbers to '{client.get('username')}' (ID: {client_id}) ===")
 
-    existing = []
+    existing = set()
     if skip_existing:
-        existing = [n.get("number", "") for n in (client.get("numbers") or [])]
+        existing = {n.get("number", "") for n in (client.get("numbers") or [])}
         print(f"  Client has {len(existing)} existing numbers.")
 
-    added, skipped, failed = 0, 0, 0
+    counts = {"added": 0, "skipped": 0, "failed": 0}
+    to_add = []
     for num in numbers:
         if num in existing:
             print(f"  {num}: ⏭️ already exists, skipping")
-            skipped += 1
-            continue
-
-        payload = {"number": num, "carrier": carrier}
-        try:
-            resp = post_json(f"/clients/{client_id}/numbers", payload)
-        except requests.RequestException as e:
-            print(f"  {num}: ❌ network error: {e}")
-            failed += 1
+            counts["skipped"] += 1
             continue
+        existing.add(num)  # Track for duplicates in same batch
+        to_add.append(num)
 
-        if 200 <= resp.status_code < 300:
-            print(f"  {num}: ✅ added")
-            added += 1
-            existing.append(num)  # Track for duplicates in same batch
-        else:
-            try:
-                body = resp.json()
-                err = body.get("error", str(body))
-            except Exception:
-                err = resp.text
-            if "already exists" in str(err).lower():
-                print(f"  {num}: ⏭️ already exists")
-                skipped += 1
-            else:
-                print(f"  {num}: ❌ failed ({resp.status_code}) -> {err}")
-                failed += 1
+    if to_add:
+        _add_numbers_batch(client_id, to_add, carrier, counts)
 
-    print(f"\nDone: {added} added, {skipped} skipped, {failed} failed")
+    if counts["added"]:
+        invalidate_cache("/clients")
+    print(f"\nDone: {counts['added']} added, {counts['skipped']} skipped, {counts['failed']} failed")
 
 
 def list_client_numbers(username: str) -> None:
@@ -552,8 +937,10 @@ def list_client_numbers(username: str) -> None:
         print("No numbers configured.")
         return
 
-    print(f"\n{'Number':<15} {'Carrier':<12} {'Tag':<15} {'Group':<15} {'Limit':<8}")
-    print("-" * 70)
+    rows = [
+        f"\n{'Number':<15} {'Carrier':<12} {'Tag':<15} {'Group':<15} {'Limit':<8}",
+        "-" * 70,
+    ]
     for n in numbers:
         num = n.get("number", "")
         carrier = n.get("carrier", "")
@@ -561,7 +948,8 @@ def list_client_numbers(username: str) -> None:
         group = n.get("group", "") or "-"
         limit = n.get("sms_limit", 0)
         limit_str = str(limit) if limit > 0 else "-"
-        print(f"{num:<15} {carrier:<12} {tag:<15} {group:<15} {limit_str:<8}")
+        rows.append(f"{num:<15} {carrier:<12} {tag:<15} {group:<15} {limit_str:<8}")
+    write_rows(rows)
 
 
 # =============================================================================
@@ -571,33 +959,35 @@ def list_client_numbers(username: str) -> None:
 def reload_all() -> None:
     """Trigger reload of clients and carriers."""
     print("\n=== Reload All ===")
-    try:
-        resp = post_json("/clients/reload", {})
-        if 200 <= resp.status_code < 300:
-            print("✅ Clients reloaded.")
-        else:
-            print(f"❌ Client reload failed ({resp.status_code})")
-    except requests.RequestException as e:
-        print(f"Network error: {e}")
-
-    try:
-        resp = post_json("/carriers/reload", {})
+    invalidate_cache("/clients", "/carriers")
+    auth_tuple()  # resolve (and prompt, if needed) before the workers start
+    # The two reloads are independent, so wait for both at once.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futures = [
+            ("Client", ex.submit(post_json, "/clients/reload", {}, RETRY_SESSION)),
+            ("Carrier", ex.submit(post_json, "/carriers/reload", {}, RETRY_SESSION)),
+        ]
+
+    for label, fut in futures:
+        try:
+            resp = fut.result()
+        except requests.RequestException as e:
+            print(f"Network error: {e}")
+            continue
         if 200 <= resp.status_code < 300:
-            print("✅ Carriers reloaded.")
+            print(f"✅ {label}s reloaded.")
         else:
-            print(f"❌ Carrier reload failed ({resp.status_code})")
-    except requests.RequestException as e:
-        print(f"Network error: {e}")
+            print(f"❌ {label} reload failed ({resp.status_code})")
 
 
 def patch_json(path: str, payload: dict) -> requests.Response:
     """Send PATCH request."""
     url = f"{base_url()}{path}"
-    return requests.patch(
+    return SESSION.patch(
         url,
         auth=auth_tuple(),
         headers={"Content-Type": "application/json"},
-        data=json.dumps(payload),
+        data=_dumps(payload),
         timeout=TIMEOUT,
     )
 
@@ -605,7 +995,7 @@ def patch_json(path: str, payload: dict) -> requests.Response:
 def delete_json(path: str) -> requests.Response:
     """Send DELETE request."""
     url = f"{base_url()}{path}"
-    return requests.delete(
+    return SESSION.delete(
         url,
         auth=auth_tuple(),
         timeout=TIMEOUT,
@@ -640,13 +1030,11 @@ def change_client_password(identifier: str) -> None:
         return
 
     if 200 <= resp.status_code < 300:
+        invalidate_cache("/clients")
         print("✅ Password updated successfully.")
     else:
         print(f"❌ Failed ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
 
 
 # =============================================================================
@@ -673,7 +1061,7 @@ def list_api_keys(identifier: str) -> Optional[List[Dict[str, Any]]]:
         print(f"❌ Failed to list API keys ({resp.status_code})")
         return None
 
-    keys = resp.json()
+    keys = _loads(resp)
     if not keys:
         print("No API keys found.")
         return []
@@ -759,7 +1147,7 @@ def create_api_key_interactive(identifier: str) -> Optional[str]:
         return None
 
     if 200 <= resp.status_code < 300:
-        data = resp.json()
+        data = _loads(resp)
         raw_key = data.get("key", "")
         print(f"\n✅ API Key created: {name}")
         print(f"\n🔑 Raw Key (SAVE NOW — will not be shown again):")
@@ -770,10 +1158,7 @@ def create_api_key_interactive(identifier: str) -> Optional[str]:
         return raw_key
     else:
         print(f"❌ Failed to create API key ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
         return None
 
 
@@ -811,10 +1196,7 @@ def revoke_api_key(identifier: str) -> None:
         print(f"✅ API key {key_id_str} revoked.")
     else:
         print(f"❌ Failed ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
 
 
 # =============================================================================
@@ -840,20 +1222,17 @@ def list_batch_jobs(identifier: str) -> Optional[List[Dict[str, Any]]]:
 
     try:
         url = f"{base_url()}/messages/batch"
-        resp = requests.get(url, auth=(username, client_password), timeout=TIMEOUT)
+        resp = SESSION.get(url, auth=(username, client_password), timeout=TIMEOUT)
     except requests.RequestException as e:
         print(f"Network error: {e}")
         return None
 
     if resp.status_code != 200:
         print(f"❌ Failed ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
         return None
 
-    jobs = resp.json()
+    jobs = _loads(resp)
     if not jobs:
         print("No batch jobs found.")
         return []
@@ -895,7 +1274,7 @@ def show_batch_job_detail(identifier: str) -> None:
     # Get job status
     try:
         url = f"{base_url()}/messages/batch/{job_id}"
-        resp = requests.get(url, auth=(username, client_password), timeout=TIMEOUT)
+        resp = SESSION.get(url, auth=(username, client_password), timeout=TIMEOUT)
     except requests.RequestException as e:
         print(f"Network error: {e}")
         return
@@ -904,7 +1283,7 @@ def show_batch_job_detail(identifier: str) -> None:
         print(f"❌ Job not found ({resp.status_code})")
         return
 
-    job = resp.json()
+    job = _loads(resp)
     print(f"\n=== Batch Job {job_id} ===")
     print(f"  Status:     {job.get('status')}")
     print(f"  Total:      {job.get('total_count', 0)}")
@@ -932,13 +1311,13 @@ def show_batch_job_detail(identifier: str) -> None:
             msg_url = f"{base_url()}/messages/batch/{job_id}/messages"
             if status_filter:
                 msg_url += f"?status={status_filter}"
-            msg_resp = requests.get(msg_url, auth=(username, client_password), timeout=TIMEOUT)
+            msg_resp = SESSION.get(msg_url, auth=(username, client_password), timeout=TIMEOUT)
         except requests.RequestException as e:
             print(f"Network error: {e}")
             return
 
         if msg_resp.status_code == 200:
-            items = msg_resp.json()
+            items = _loads(msg_resp)
             print(f"\n  Messages ({len(items)}):")
             print(f"  {'#':<5} {'ID':<38} {'To':<15} {'Status':<12} {'Error':<30}")
             print("  " + "-" * 105)
@@ -978,7 +1357,7 @@ def list_failovers(identifier: str) -> None:
         print(f"❌ Failed to list failovers ({resp.status_code})")
         return
 
-    failovers = resp.json()
+    failovers = _loads(resp)
     if not failovers:
         print("No failovers configured.")
         return
@@ -1010,16 +1389,17 @@ def add_failover_interactive(identifier: str) -> None:
     # List available clients for selection
     print("\nAvailable clients:")
     try:
-        resp = get_json("/clients")
+        index = client_index("/clients")
     except requests.RequestException as e:
         print(f"Network error: {e}")
         return
 
-    if resp.status_code != 200:
+    if index is None:
         print("❌ Failed to list clients")
         return
 
-    all_clients = resp.json()
+    by_id, _ = index
+    all_clients = list(by_id.values())
     # Filter out the primary client and web-only clients
     eligible = [c for c in all_clients if c.get("id") != client_id and c.get("type", "legacy") == "legacy"]
 
@@ -1048,10 +1428,8 @@ def add_failover_interactive(identifier: str) -> None:
             fallback_client_id = eligible[choice_num - 1].get("id")
         else:
             # Maybe it's a direct client ID
-            for c in all_clients:
-                if c.get("id") == choice_num:
-                    fallback_client_id = choice_num
-                    break
+            if choice_num in by_id:
+                fallback_client_id = choice_num
 
     if fallback_client_id is None:
         print("Invalid selection.")
@@ -1082,10 +1460,7 @@ def add_failover_interactive(identifier: str) -> None:
         print("✅ Failover added.")
     else:
         print(f"❌ Failed ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
 
 
 def remove_failover(identifier: str) -> None:
@@ -1120,10 +1495,7 @@ def remove_failover(identifier: str) -> None:
         print(f"✅ Failover {failover_id_str} removed.")
     else:
         print(f"❌ Failed ({resp.status_code})")
-        try:
-            print(resp.json())
-        except Exception:
-            print(resp.text)
+        print(_err_body(resp))
 
 
 def show_smpp_status(identifier: str) -> None:
@@ -1146,7 +1518,7 @@ def show_smpp_status(identifier: str) -> None:
         print(f"❌ Failed ({resp.status_code})")
         return
 
-    data = resp.json()
+    data = _loads(resp)
     online = data.get("online", False)
     ip = data.get("ip", "")
 
@@ -1169,6 +1541,26 @@ def show_smpp_status(identifier: str) -> None:
 # Menu
 # =============================================================================
 
+def read_numbers_block() -> str:
+    """Read a pasted block of numbers from stdin.
+
+    On a terminal the paste is read in one go until Ctrl+D. Piped input stops
+    at the first empty line so later menu answers are left unread.
+    """
+    print("Enter numbers (comma-separated or one per line, E.164 OK e.g. +12505551234).")
+    if sys.stdin.isatty():
+        print("Paste them, then press Ctrl+D on an empty line to finish.")
+        return sys.stdin.read()
+    print("Press ENTER on an empty line to finish (or Ctrl+D).")
+    lines = []
+    for line in iter(sys.stdin.readline, ""):
+        line = line.rstrip("\n")
+        if not line:
+            break
+        lines.append(line)
+    return ",".join(lines)
+
+
 def menu() -> None:
     last_client: Optional[str] = None
 
@@ -1268,23 +1660,12 @@ def menu() -> None:
             
             # Show available carriers
             print("\nAvailable carriers (from gateway):")
-            carriers = list_carriers()
-            carrier_names = [c.get("name", "") for c in (carriers or [])]
-            
+            carriers = fetch_carriers()
+            if carriers is not None:
+                print_carrier_names(carriers)
+
             carrier = input("Carrier name (default: telnyx): ").strip() or "telnyx"
-            print("Enter numbers (comma-separated or one per line, E.164 OK e.g. +12505551234).")
-            print("Press ENTER on an empty line to finish (or Ctrl+D).")
-            try:
-                lines = []
-                while True:
-                    line = input()
-                    if not line:
-                        break
-                    lines.append(line)
-            except EOFError:
-                pass
-            raw = ",".join(lines)
-            nums = parse_numbers_csv(raw)
+            nums = parse_numbers_csv(read_numbers_block())
             if nums:
                 add_numbers_to_client(identifier, nums, carrier=carrier)
                 last_client = identifier
@@ -1378,22 +1759,12 @@ def menu() -> None:
 
             # Show carriers
             print("\nAvailable carriers:")
-            list_carriers()
-            
+            carriers = fetch_carriers()
+            if carriers is not None:
+                print_carrier_names(carriers)
+
             carrier = input("Carrier name (default: telnyx): ").strip() or "telnyx"
-            print("Enter numbers (comma-separated or one per line, E.164 OK e.g. +12505551234).")
-            print("Press ENTER on an empty line to finish (or Ctrl+D).")
-            try:
-                lines = []
-                while True:
-                    line = input()
-                    if not line:
-                        break
-                    lines.append(line)
-            except EOFError:
-                pass
-            raw = ",".join(lines)
-            nums = parse_numbers_csv(raw)
+            nums = parse_numbers_csv(read_numbers_block())
             if nums:
                 add_numbers_to_client(username, nums, carrier=carrier)
             else:
@@ -1415,6 +1786,11 @@ def main():
         menu()
     except KeyboardInterrupt:
         print("\nInterrupted. Bye!")
+    except EOFError:
+        print("\nEnd of input. Bye!")
+    finally:
+        SESSION.close()
+        RETRY_SESSION.close()
 
 
 if __name__ == "__main__":
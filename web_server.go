@@ -64,6 +64,12 @@ type PasswordUpdateRequest struct {
 	NewPassword string `json:"new_password"`
 }
 
+// BatchNumbersRequest defines the expected JSON request body for adding
+// several numbers to a client in one call.
+type BatchNumbersRequest struct {
+	Numbers []ClientNumber `json:"numbers"`
+}
+
 // StatsResponse represents the overall statistics response.
 type StatsResponse struct {
 	SMPPConnectedClients int              `json:"smpp_connected_clients"`
@@ -460,6 +466,53 @@ func SetupClientRoutes(app *iris.Application, gateway *Gateway) {
 			ctx.JSON(responseNumber)
 		})
 
+		// Add several numbers to a client in one request
+		clients.Post("/{id}/numbers/batch", func(ctx iris.Context) {
+			clientIDStr := ctx.Params().Get("id")
+			clientID, err := strconv.ParseUint(clientIDStr, 10, 32)
+			if err != nil {
+				ctx.StatusCode(iris.StatusBadRequest)
+				ctx.JSON(iris.Map{"error": "Invalid client ID"})
+				return
+			}
+
+			var req BatchNumbersRequest
+			if err := ctx.ReadJSON(&req); err != nil {
+				ctx.StatusCode(iris.StatusBadRequest)
+				ctx.JSON(iris.Map{"error": "Invalid number data"})
+				return
+			}
+
+			if gateway.getClientByID(uint(clientID)) == nil {
+				ctx.StatusCode(iris.StatusNotFound)
+				ctx.JSON(iris.Map{"error": "Client not found"})
+				return
+			}
+
+			added := []string{}
+			skipped := []string{}
+			failed := []iris.Map{}
+			for i := range req.Numbers {
+				newNumber := &req.Numbers[i]
+				if newNumber.Number == "" || newNumber.Carrier == "" {
+					failed = append(failed, iris.Map{"number": newNumber.Number, "error": "Number and Carrier are required"})
+					continue
+				}
+
+				if err := gateway.addNumber(uint(clientID), newNumber); err != nil {
+					if strings.Contains(err.Error(), "already exists") {
+						skipped = append(skipped, newNumber.Number)
+					} else {
+						failed = append(failed, iris.Map{"number": newNumber.Number, "error": err.Error()})
+					}
+					continue
+				}
+				added = append(added, newNumber.Number)
+			}
+
+			ctx.JSON(iris.Map{"added": added, "skipped": skipped, "failed": failed})
+		})
+
 		// Get all numbers for a specific client
 		clients.Get("/{id}/numbers", func(ctx iris.Context) {
 			clientIDStr := ctx.Params().Get("id")
@@ -616,13 +669,18 @@ func SetupClientRoutes(app *iris.Application, gateway *Gateway) {
 			})
 		})
 
-		// Get all clients
+		// Get all clients, optionally filtered by ?username=
 		clients.Get("/", func(ctx iris.Context) {
+			username := ctx.URLParam("username")
+
 			gateway.mu.RLock()
 			defer gateway.mu.RUnlock()
 
 			var clientList []Client
 			for _, client := range gateway.Clients {
+				if username != "" && client.Username != username {
+					continue
+				}
 				// Return clients without exposing sensitive information
 				c := Client{
 					ID:         client.ID,
@@ -641,6 +699,37 @@ func SetupClientRoutes(app *iris.Application, gateway *Gateway) {
 			ctx.JSON(clientList)
 		})
 
+		// Get a single client
+		clients.Get("/{id}", func(ctx iris.Context) {
+			clientIDStr := ctx.Params().Get("id")
+			clientID, err := strconv.ParseUint(clientIDStr, 10, 32)
+			if err != nil {
+				ctx.StatusCode(iris.StatusBadRequest)
+				ctx.JSON(iris.Map{"error": "Invalid client ID"})
+				return
+			}
+
+			client := gateway.getClientByID(uint(clientID))
+			if client == nil {
+				ctx.StatusCode(iris.StatusNotFound)
+				ctx.JSON(iris.Map{"error": "Client not found"})
+				return
+			}
+
+			// Return the client without exposing sensitive information
+			ctx.JSON(Client{
+				ID:         client.ID,
+				Username:   client.Username,
+				Name:       client.Name,
+				Address:    client.Address,
+				Type:       client.Type,
+				Timezone:   client.Timezone,
+				LogPrivacy: client.LogPrivacy,
+				Settings:   client.Settings,
+				Numbers:    client.Numbers,
+			})
+		})
+
 		// Update a number's properties
 		clients.Put("/{id}/numbers/{number_id}", func(ctx iris.Context) {
 			clientIDStr := ctx.Params().Get("id")